@@ -7,21 +7,52 @@ Based on the comick.io Intelligence Briefing API documentation
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import requests
+import aiohttp
+import asyncio
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import threading
 from PIL import Image, ImageTk
+import img2pdf
+import diskcache
 import io
 import urllib.parse
 from typing import List, Dict, Optional, Tuple
 import os
+import tempfile
 from PIL import Image
 import sys
 import zipfile
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resized pages kept for instant re-navigation in the reader
+PHOTO_CACHE_SIZE = 32
+# How long search results and manga details stay cached on disk
+SEARCH_CACHE_TTL = 24 * 60 * 60
+# Concurrent chapter manifest requests, and images fetched per batch, when downloading a manga
+MANIFEST_CONCURRENCY = 8
+IMAGE_BATCH_SIZE = 10
+
+def _json_loads(data):
+    """Parse JSON bytes, with orjson when it is installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes, with orjson when it is installed"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
 
 class MangaAPI:
     """Handles all API interactions with comick.io"""
     
-    def __init__(self):
+    def __init__(self, save_dir: str, cache_limit_mb: int = 500):
         self.base_url = "https://api.comick.io"
         self.cdn_url = "https://meo.comick.pictures"
         self.headers = {
@@ -37,39 +68,94 @@ class MangaAPI:
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-site',
         }
+        
+        # One pooled session for both hosts so page downloads reuse connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount(self.base_url, adapter)
+        self.session.mount(self.cdn_url, adapter)
+        
+        # Search results and manga details persist across sessions
+        self.search_cache = diskcache.Cache(os.path.join(save_dir, "search_cache"))
+        
+        # Memoize the pure lookups per instance; see clear_cache()
+        self.get_manga_details = lru_cache(maxsize=256)(self.get_manga_details)
+        self.get_chapters = lru_cache(maxsize=256)(self.get_chapters)
+        self.get_chapter_pages = lru_cache(maxsize=256)(self.get_chapter_pages)
+        
+        # Content-addressed image cache on disk, bounded to cache_limit_mb
+        self.cache_dir = os.path.join(save_dir, "cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache_limit = cache_limit_mb * 1024 * 1024
+        self._cache_lock = threading.Lock()
+        self._cache_size = sum(entry.stat().st_size for entry in os.scandir(self.cache_dir)
+                               if entry.is_file() and not entry.name.endswith(".tmp"))
+    
+    def clear_cache(self):
+        """Forget memoized API responses"""
+        self.get_manga_details.cache_clear()
+        self.get_chapters.cache_clear()
+        self.get_chapter_pages.cache_clear()
+        self.search_cache.clear()
+    
+    def close(self):
+        """Close pooled connections and the search cache"""
+        self.session.close()
+        self.search_cache.close()
     
     def search_manga(self, query: str, limit: int = 20) -> List[Dict]:
         """Search for manga by title"""
+        key = ("search", query.lower(), limit)
+        results = self.search_cache.get(key)
+        if results is not None:
+            return results
+        
         try:
             encoded_query = urllib.parse.quote_plus(query)
             url = f"{self.base_url}/v1.0/search?q={encoded_query}&limit={limit}"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            return response.json()
+            results = _json_loads(response.content)
         except requests.RequestException as e:
             raise Exception(f"Search failed: {str(e)}")
+        
+        self.search_cache.set(key, results, expire=SEARCH_CACHE_TTL)
+        return results
     
     def get_manga_details(self, slug: str) -> Dict:
         """Get manga details from slug"""
+        key = ("details", slug)
+        details = self.search_cache.get(key)
+        if details is not None:
+            return details
+        
         try:
             url = f"{self.base_url}/comic/{slug}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            return response.json()
+            details = _json_loads(response.content)
         except requests.RequestException as e:
             raise Exception(f"Failed to get manga details: {str(e)}")
+        
+        self.search_cache.set(key, details, expire=SEARCH_CACHE_TTL)
+        return details
     
     def get_chapters(self, hid: str, lang: str = "en", limit: int = 10000) -> List[Dict]:
         """Get chapter list for a manga"""
         try:
             url = f"{self.base_url}/comic/{hid}/chapters?lang={lang}&limit={limit}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             return data.get('chapters', [])
         except requests.RequestException as e:
             raise Exception(f"Failed to get chapters: {str(e)}")
@@ -78,10 +164,10 @@ class MangaAPI:
         """Get page images for a chapter"""
         try:
             url = f"{self.base_url}/chapter/{chapter_hid}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             return data.get('chapter', {}).get('md_images', [])
         except requests.RequestException as e:
             raise Exception(f"Failed to get chapter pages: {str(e)}")
@@ -97,11 +183,111 @@ class MangaAPI:
     def download_image(self, url: str) -> bytes:
         """Download image data"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
             return response.content
         except requests.RequestException as e:
             raise Exception(f"Failed to download image: {str(e)}")
+    
+    def _cache_path(self, b2key: str) -> str:
+        return os.path.join(self.cache_dir, b2key.replace("/", "_"))
+    
+    def read_cached_image(self, b2key: str) -> Optional[bytes]:
+        """Return cached image data, or None on a cache miss"""
+        path = self._cache_path(b2key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used even on noatime mounts
+            return data
+        except OSError:
+            return None
+    
+    def cache_image(self, b2key: str, data: bytes):
+        """Atomically store image data in the cache, evicting old entries past the limit"""
+        path = self._cache_path(b2key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            with self._cache_lock:
+                try:
+                    replaced = os.stat(path).st_size  # Overwriting a key must not count it twice
+                except OSError:
+                    replaced = 0
+                os.replace(tmp_path, path)
+                self._cache_size += len(data) - replaced
+                if self._cache_size > self.cache_limit:
+                    self._evict_cache()
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _evict_cache(self):
+        """Remove least recently used cache entries until under 90% of the limit"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+        entries.sort()
+        
+        total = sum(size for _, size, _ in entries)
+        target = self.cache_limit * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._cache_size = total
+    
+    def get_image(self, b2key: str) -> bytes:
+        """Get page image data, from the disk cache when available"""
+        data = self.read_cached_image(b2key)
+        if data is None:
+            data = self.download_image(self.get_page_url(b2key))
+            self.cache_image(b2key, data)
+        return data
+    
+    def aio_session(self) -> aiohttp.ClientSession:
+        """Create a pooled aiohttp session; must be called inside a running event loop"""
+        connector = aiohttp.TCPConnector(limit=16, limit_per_host=8)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector)
+    
+    async def aio_download_chapter(self, session: aiohttp.ClientSession, chapter_hid: str) -> List[Dict]:
+        """Get page images for a chapter (async)"""
+        try:
+            url = f"{self.base_url}/chapter/{chapter_hid}"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+            
+            return data.get('chapter', {}).get('md_images', [])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Failed to get chapter pages: {str(e)}")
+    
+    async def aio_download_image(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """Download image data (async)"""
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response.raise_for_status()
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Failed to download image: {str(e)}")
+    
+    async def aio_get_image(self, session: aiohttp.ClientSession, b2key: str) -> bytes:
+        """Get page image data, from the disk cache when available (async)"""
+        # Disk I/O (and any eviction scan) runs off the event loop so other fetches keep going
+        data = await asyncio.to_thread(self.read_cached_image, b2key)
+        if data is None:
+            data = await self.aio_download_image(session, self.get_page_url(b2key))
+            await asyncio.to_thread(self.cache_image, b2key, data)
+        return data
 
 class MangaReader:
     """Main application class"""
@@ -113,16 +299,42 @@ class MangaReader:
         self.root.title("Manga Reader")
         self.root.geometry("1200x800")
         
-        self.api = MangaAPI()
+        self.api = MangaAPI(self.save_dir)
         self.current_manga = None
         self.current_chapters = []
         self.current_chapter_pages = []
         self.current_page_index = 0
         
+        # Shared, bounded pool for all background work triggered from the UI
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="io")
+        # Set on close so a long manga download stops early instead of outliving the window
+        self._closing = threading.Event()
+        
+        # Background fetches of neighbouring pages into the image cache
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=4)
+        self._prefetch_inflight = {}  # b2key -> Future of the running prefetch
+        
+        # (b2key, frame_width, frame_height) -> resized PhotoImage, in LRU order
+        self._photo_cache = OrderedDict()
+        
+        # Pending debounced save_progress, see schedule_save_progress()
+        self._save_after_id = None
+        # Serializes progress writes; _progress_seq lets an older snapshot lose to a newer one
+        self._progress_lock = threading.Lock()
+        self._progress_seq = 0
+        self._progress_written = 0
+        
         self.setup_ui()
         
     def setup_ui(self):
         """Setup the user interface"""
+        # Menu bar
+        menubar = tk.Menu(self.root)
+        cache_menu = tk.Menu(menubar, tearoff=0)
+        cache_menu.add_command(label="Clear Cache", command=self.clear_cache)
+        menubar.add_cascade(label="Cache", menu=cache_menu)
+        self.root.config(menu=menubar)
+        
         # Main notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -236,6 +448,9 @@ class MangaReader:
         # Image display
         self.image_frame = ttk.Frame(self.reader_frame)
         self.image_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Track the display area size so page loads never force a relayout
+        self._frame_size = (1200, 800)
+        self.image_frame.bind("<Configure>", lambda e: setattr(self, "_frame_size", (e.width, e.height)))
         
         self.image_label = ttk.Label(self.image_frame, text="No image loaded")
         self.image_label.pack(expand=True)
@@ -264,16 +479,17 @@ class MangaReader:
             finally:
                 self.root.after(0, lambda: self.search_button.config(state=tk.NORMAL))
         
-        threading.Thread(target=search_thread, daemon=True).start()
+        self._io_pool.submit(search_thread)
     
     def display_search_results(self, results):
         """Display search results"""
         self.search_results = results
         self.results_listbox.delete(0, tk.END)
         
-        for manga in results:
-            title = manga.get('title', 'Unknown Title')
-            self.results_listbox.insert(tk.END, title)
+        # One Tcl call for all rows
+        titles = [manga.get('title', 'Unknown Title') for manga in results]
+        if titles:
+            self.results_listbox.insert(tk.END, *titles)
         
         self.status_var.set(f"Found {len(results)} results")
     
@@ -311,7 +527,7 @@ class MangaReader:
             except Exception as e:
                 self.root.after(0, self.show_error, f"Failed to load manga: {str(e)}")
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self._io_pool.submit(load_thread)
     
     def display_manga_details(self, comic_info, chapters):
         """Display manga details and chapters"""
@@ -328,13 +544,12 @@ class MangaReader:
         
         # Update chapters list
         self.chapters_listbox.delete(0, tk.END)
-        for chapter in chapters:
-            chap_num = chapter.get('chap', 'Unknown')
-            title = chapter.get('title', '')
-            display_text = f"Chapter {chap_num}"
-            if title:
-                display_text += f": {title}"
-            self.chapters_listbox.insert(tk.END, display_text)
+        entries = [
+            f"Chapter {chapter.get('chap', 'Unknown')}" + (f": {chapter['title']}" if chapter.get('title') else "")
+            for chapter in chapters
+        ]
+        if entries:
+            self.chapters_listbox.insert(tk.END, *entries)
         
         # Switch to details tab
         self.notebook.select(self.details_frame)
@@ -371,7 +586,7 @@ class MangaReader:
             except Exception as e:
                 self.root.after(0, self.show_error, f"Failed to load chapter: {str(e)}")
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self._io_pool.submit(load_thread)
     
     def display_chapter(self, pages, chapter):
         """Display chapter in reader"""
@@ -395,36 +610,90 @@ class MangaReader:
         
         self.current_page_index = page_index
         page = self.current_chapter_pages[page_index]
+        b2key = page.get('b2key', '')
         
         self.page_info_var.set(f"Page {page_index + 1} of {len(self.current_chapter_pages)}")
         self.image_label.config(text="Loading image...")
         
-        def load_image_thread():
-            try:
-                b2key = page.get('b2key', '')
-                if not b2key:
-                    raise Exception("No image key found")
-                
-                url = self.api.get_page_url(b2key)
-                image_data = self.api.download_image(url)
-                
-                self.root.after(0, self.display_image, image_data)
-            except Exception as e:
-                self.root.after(0, self.show_error, f"Failed to load page: {str(e)}")
+        # Get display area size
+        frame_width, frame_height = self._frame_size
         
-        threading.Thread(target=load_image_thread, daemon=True).start()
-        self.save_progress()
+        key = (b2key, frame_width, frame_height)
+        photo = self._photo_cache.get(key)
+        if photo is not None:
+            self._photo_cache.move_to_end(key)
+            self.image_label.config(image=photo, text="")
+            self.image_label.image = photo  # Keep reference
+        else:
+            # A prefetch still fetching this page is waited on rather than downloaded again
+            prefetch = self._prefetch_inflight.get(b2key)
+            
+            def load_image_thread():
+                try:
+                    if not b2key:
+                        raise Exception("No image key found")
+                    
+                    image_data = None
+                    if prefetch is not None:
+                        try:
+                            image_data = prefetch.result()
+                        except Exception:
+                            pass  # Cancelled or failed prefetch; fetch it ourselves
+                    if image_data is None:
+                        image_data = self.api.get_image(b2key)
+                    
+                    # Decode and resize here, not on the Tk main thread: a quick
+                    # BILINEAR preview (fits the frame, never scales up) first ...
+                    img = Image.open(io.BytesIO(image_data))
+                    img.thumbnail((frame_width, frame_height), Image.Resampling.BILINEAR)
+                    self.root.after(0, self.display_image, img, page_index, key)
+                    
+                    # ... then the LANCZOS version, which replaces it once ready
+                    self._upgrade_lanczos(image_data, frame_width, frame_height, page_index, key)
+                except Exception as e:
+                    self.root.after(0, self.show_error, f"Failed to load page: {str(e)}")
+            
+            self._io_pool.submit(load_image_thread)
+        
+        self.prefetch_pages(page_index)
+        self.schedule_save_progress()
+    
+    def prefetch_pages(self, page_index):
+        """Warm the image cache for the pages around page_index"""
+        for j in (page_index + 1, page_index + 2, page_index - 1):
+            if j < 0 or j >= len(self.current_chapter_pages):
+                continue
+            b2key = self.current_chapter_pages[j].get('b2key', '')
+            if not b2key or b2key in self._prefetch_inflight:
+                continue
+            future = self._prefetch_pool.submit(self.api.get_image, b2key)
+            self._prefetch_inflight[b2key] = future
+            future.add_done_callback(lambda f, key=b2key: self._prefetch_inflight.pop(key, None))
     
-    def display_image(self, image_data):
-        """Display the loaded image"""
+    def display_image(self, img, page_index, key, cache=False):
+        """Display an already decoded and resized page if the user is still on it"""
         try:
-            # Open image with PIL
-            img = Image.open(io.BytesIO(image_data))
+            # Convert to PhotoImage
+            photo = ImageTk.PhotoImage(img)
+            
+            if cache:
+                self._photo_cache[key] = photo
+                if len(self._photo_cache) > PHOTO_CACHE_SIZE:
+                    self._photo_cache.popitem(last=False)
             
-            # Get display area size
-            self.image_frame.update()
-            frame_width = self.image_frame.winfo_width()
-            frame_height = self.image_frame.winfo_height()
+            pages = self.current_chapter_pages
+            if self.current_page_index == page_index and page_index < len(pages) and pages[page_index].get('b2key') == key[0]:
+                # Update label
+                self.image_label.config(image=photo, text="")
+                self.image_label.image = photo  # Keep reference
+            
+        except Exception as e:
+            self.show_error(f"Failed to display image: {str(e)}")
+    
+    def _upgrade_lanczos(self, image_data, frame_width, frame_height, page_index, key):
+        """Resize a page with LANCZOS off the main thread, then hand it to the UI"""
+        try:
+            img = Image.open(io.BytesIO(image_data))
             
             # Calculate scaling to fit frame while maintaining aspect ratio
             img_width, img_height = img.size
@@ -435,18 +704,11 @@ class MangaReader:
             new_width = int(img_width * scale)
             new_height = int(img_height * scale)
             
-            # Resize image
+            # Resize image (PIL releases the GIL here, so the UI stays responsive)
             img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(img)
-            
-            # Update label
-            self.image_label.config(image=photo, text="")
-            self.image_label.image = photo  # Keep reference
-            
-        except Exception as e:
-            self.show_error(f"Failed to display image: {str(e)}")
+            self.root.after(0, self.display_image, img, page_index, key, True)
+        except Exception:
+            pass  # The preview stays on screen
     
     def prev_page(self):
         """Go to previous page"""
@@ -468,62 +730,141 @@ class MangaReader:
         pdf_filename = os.path.join(self.save_dir, f"{title}.pdf")
         self.status_var.set("Downloading manga...")
 
+        chapters = list(self.current_chapters)
+
+        async def _download_all():
+            """Fetch all chapter manifests, then all page images in batches"""
+            async with self.api.aio_session() as session:
+                semaphore = asyncio.Semaphore(MANIFEST_CONCURRENCY)
+
+                async def bounded(coro):
+                    async with semaphore:
+                        return await coro
+
+                # All manifests arrive before the first image request goes out
+                chapter_hids = [chapter.get('hid', '') for chapter in chapters]
+                manifests = await asyncio.gather(
+                    *[bounded(self.api.aio_download_chapter(session, hid)) for hid in chapter_hids if hid]
+                )
+
+                b2keys = [page['b2key'] for pages in manifests for page in pages if page.get('b2key')]
+
+                image_data = []
+                for i in range(0, len(b2keys), IMAGE_BATCH_SIZE):
+                    if self._closing.is_set():
+                        return None
+                    chunk = b2keys[i:i + IMAGE_BATCH_SIZE]
+                    image_data.extend(await asyncio.gather(*[self.api.aio_get_image(session, k) for k in chunk]))
+                return image_data
+
+        def _prepare(data):
+            """Return page bytes img2pdf can embed losslessly, re-encoding only unsupported images"""
+            if self._closing.is_set():
+                return None
+            try:
+                with Image.open(io.BytesIO(data)) as img:  # Only parses the header
+                    if img.format == "JPEG" or (img.format == "PNG" and 'A' not in img.mode and 'transparency' not in img.info):
+                        return data
+                    rgb = img if img.mode == "RGB" else img.convert("RGB")
+                    out = io.BytesIO()
+                    rgb.save(out, format="JPEG", quality=95)
+                    rgb.close()  # Free decoded pixels right away
+                    return out.getvalue()
+            except Exception:
+                return None
+
         def download_thread():
             try:
-                image_list = []
-                for chapter in self.current_chapters:
-                    chapter_hid = chapter.get('hid', '')
-                    if not chapter_hid:
-                        continue
-                    pages = self.api.get_chapter_pages(chapter_hid)
-                    for page in pages:
-                        b2key = page.get('b2key', '')
-                        if not b2key:
-                            continue
-                        url = self.api.get_page_url(b2key)
-                        img_data = self.api.download_image(url)
-                        try:
-                            img = Image.open(io.BytesIO(img_data)).convert("RGB")
-                            image_list.append(img)
-                        except Exception:
-                            pass
-                # Save PDF if images were downloaded
-                if image_list:
-                    image_list[0].save(
-                        pdf_filename,
-                        save_all=True,
-                        append_images=image_list[1:],
-                        resolution=100.0,
-                        quality=95
-                    )
+                byte_list = asyncio.run(_download_all())
+                if byte_list is None:
+                    return
+                # PIL releases the GIL while decoding, so fallback re-encodes run in parallel
+                pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+                try:
+                    # Replace pages in place (in order) so re-encoded originals are freed as we go
+                    for i, page in enumerate(pool.map(_prepare, byte_list)):
+                        byte_list[i] = page
+                finally:
+                    pool.shutdown()
+                if self._closing.is_set():
+                    return
+                page_list = [page for page in byte_list if page is not None]
+                del byte_list
+                # Save PDF if images were downloaded; JPEG/PNG data is embedded without re-encoding
+                if page_list:
+                    with open(pdf_filename, "wb") as f:
+                        img2pdf.convert(page_list, outputstream=f)
                 self.root.after(0, lambda: self.status_var.set(f"Downloaded as {pdf_filename}"))
                 self.root.after(0, lambda: messagebox.showinfo("Download Complete", f"Saved as {pdf_filename}"))
             except Exception as e:
-                self.root.after(0, lambda: self.show_error(f"Download failed: {str(e)}"))
+                if not self._closing.is_set():
+                    self.root.after(0, lambda: self.show_error(f"Download failed: {str(e)}"))
 
+        # Daemon thread rather than the shared pool: the interpreter must not wait for it at exit
         threading.Thread(target=download_thread, daemon=True).start()
 
-    def save_progress(self):
-        """Save current reading progress to a file"""
-        progress = {
+    def _current_progress(self):
+        return {
             "manga_hid": self.current_manga.get('hid') if self.current_manga else None,
             "chapter_hid": self.current_chapter_pages[self.current_page_index].get('chapter_hid') if self.current_chapter_pages else None,
             "page_index": self.current_page_index
         }
+
+    def _snapshot_progress(self):
+        self._progress_seq += 1
+        return self._progress_seq, self._current_progress()
+
+    def _write_progress(self, seq, progress):
+        """Atomically replace progress.json, unless a newer snapshot was already written"""
         progress_path = os.path.join(self.save_dir, "progress.json")
-        with open(progress_path, "w") as f:
-            json.dump(progress, f)
+        with self._progress_lock:
+            if seq < self._progress_written:
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.save_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_json_dumps(progress))
+                os.replace(tmp_path, progress_path)
+                self._progress_written = seq
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    def schedule_save_progress(self):
+        """Save progress once page turns settle, writing the file off the main thread"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._save_progress_in_background)
+
+    def _save_progress_in_background(self):
+        self._save_after_id = None
+        self._io_pool.submit(self._write_progress, *self._snapshot_progress())
+
+    def save_progress(self):
+        """Save current reading progress to a file"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._write_progress(*self._snapshot_progress())
 
     def load_progress(self):
         """Load reading progress from file"""
         progress_path = os.path.join(self.save_dir, "progress.json")
         try:
-            with open(progress_path, "r") as f:
-                progress = json.load(f)
+            with open(progress_path, "rb") as f:
+                progress = _json_loads(f.read())
             return progress
         except Exception:
             return None
     
+    def clear_cache(self):
+        """Drop cached API responses so the next lookups hit the network"""
+        self.api.clear_cache()
+        self.status_var.set("Cache cleared")
+    
     def show_error(self, message):
         """Show error message"""
         messagebox.showerror("Error", message)
@@ -539,7 +880,11 @@ class MangaReader:
         self.root.mainloop()
 
     def on_close(self):
+        self._closing.set()
         self.save_progress()
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.api.close()
         self.root.destroy()
 
 def main():
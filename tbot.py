@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
 import logging
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib.parse
 import os
 import io
 import zipfile
-import shutil
 import math # For ceiling function
+import operator
+import threading
+import collections
+import time
+import asyncio
+import httpx
 
 from typing import List, Dict
+from cachetools import TTLCache
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
 from telegram.ext import (
@@ -21,7 +30,11 @@ from telegram.ext import (
     filters,
 )
 
-# --- Start of API Code (Unchanged) ---
+# --- Start of API Code ---
+def _safe_float(value) -> float:
+    try: return float(value or 0)
+    except (TypeError, ValueError): return 0.0
+
 class MangaAPI:
     def __init__(self):
         self.base_url = "https://api.comick.io"
@@ -39,35 +52,66 @@ class MangaAPI:
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-site',
         }
+        # Pooled keep-alive connections to the API and CDN, with retries on transient errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
+        # Short-lived caches shared by every chat; popular manga get the same lookups over and over
+        self._cache_lock = threading.Lock()
+        self._chapters_cache = TTLCache(maxsize=512, ttl=600)
+        self._pages_cache = TTLCache(maxsize=2048, ttl=300)
     def search_manga(self, query: str, limit: int = 10) -> List[Dict]:
         try:
             encoded_query = urllib.parse.quote_plus(query)
             url = f"{self.base_url}/v1.0/search?q={encoded_query}&limit={limit}&t=true"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e: raise Exception(f"Search failed: {str(e)}")
     def get_chapters(self, hid: str, lang: str = "en", limit: int = 5000) -> List[Dict]:
+        key = (hid, lang, limit)
+        with self._cache_lock: cached = self._chapters_cache.get(key)
+        if cached is not None: return cached
         try:
             url = f"{self.base_url}/comic/{hid}/chapters?lang={lang}&limit={limit}"
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             chapters = data.get('chapters', [])
-            chapters.sort(key=lambda x: float(x.get('chap', 0) or 0), reverse=False)
-            return chapters
+            # Parse each chapter number once and keep it on the dict; non-numeric ones sort first
+            for chapter in chapters: chapter['_chap_f'] = _safe_float(chapter.get('chap'))
+            chapters.sort(key=operator.itemgetter('_chap_f'))
         except requests.RequestException as e: raise Exception(f"Failed to get chapters: {str(e)}")
+        with self._cache_lock: self._chapters_cache[key] = chapters
+        return chapters
     def get_chapter_pages(self, chapter_hid: str) -> List[Dict]:
+        with self._cache_lock: cached = self._pages_cache.get(chapter_hid)
+        if cached is not None: return cached
         try:
-            url = f"{self.base_url}/chapter/{chapter_hid}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(f"{self.base_url}/chapter/{chapter_hid}", timeout=10)
             response.raise_for_status()
-            data = response.json()
-            return data.get('chapter', {}).get('md_images', [])
+            pages = self._parse_chapter_pages(response.content)
         except requests.RequestException as e: raise Exception(f"Failed to get chapter pages: {str(e)}")
+        with self._cache_lock: self._pages_cache[chapter_hid] = pages
+        return pages
+    async def aget_chapter_pages(self, client: httpx.AsyncClient, chapter_hid: str) -> List[Dict]:
+        """Async get_chapter_pages over a caller-owned httpx client; shares the same page-list cache."""
+        with self._cache_lock: cached = self._pages_cache.get(chapter_hid)
+        if cached is not None: return cached
+        try:
+            response = await client.get(f"{self.base_url}/chapter/{chapter_hid}", timeout=10)
+            response.raise_for_status()
+            pages = self._parse_chapter_pages(response.content)
+        except httpx.HTTPError as e: raise Exception(f"Failed to get chapter pages: {str(e)}")
+        with self._cache_lock: self._pages_cache[chapter_hid] = pages
+        return pages
+    @staticmethod
+    def _parse_chapter_pages(content: bytes) -> List[Dict]:
+        return orjson.loads(content).get('chapter', {}).get('md_images', [])
     def download_image(self, url: str) -> bytes:
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
             return response.content
         except requests.RequestException as e: raise Exception(f"Failed to download image: {str(e)}")
@@ -82,24 +126,36 @@ logger = logging.getLogger(__name__)
 SEARCH, SELECT_MANGA, SELECT_CHAPTER = range(3)
 CHAPTERS_PER_PAGE = 8
 SAFE_LIMIT = 48 * 1024 * 1024 # 48 MB for safety
+DOWNLOAD_CONCURRENCY = 8 # Parallel CDN fetches per archive job
+PROGRESS_INTERVAL = 1.0 # Seconds between progress edits (Telegram allows ~1 edit/sec/chat)
 api = MangaAPI()
 
-# --- Keyboard Generation Functions (Unchanged) ---
-def build_chapter_keyboard(chapters: List[Dict], page: int = 0) -> InlineKeyboardMarkup:
-    keyboard = []
+# --- Keyboard Generation Functions ---
+def build_chapter_buttons(chapters: List[Dict]) -> List[InlineKeyboardButton]:
+    buttons = []
+    for chapter in chapters:
+        chap_num, title = chapter.get('chap', 'N/A'), f": {chapter['title']}" if chapter.get('title') else ""
+        buttons.append(InlineKeyboardButton(f"Ch. {chap_num}{title}"[:40], callback_data=f"dl_{chapter['hid']}"))
+    return buttons
+
+def build_chapter_keyboard(chapter_buttons: List[InlineKeyboardButton], page: int = 0) -> InlineKeyboardMarkup:
     start_index = page * CHAPTERS_PER_PAGE
     end_index = start_index + CHAPTERS_PER_PAGE
-    for chapter in chapters[start_index:end_index]:
-        chap_num, title = chapter.get('chap', 'N/A'), f": {chapter['title']}" if chapter.get('title') else ""
-        keyboard.append([InlineKeyboardButton(f"Ch. {chap_num}{title}"[:40], callback_data=f"dl_{chapter['hid']}")])
+    keyboard = [[button] for button in chapter_buttons[start_index:end_index]]
     nav_row = []
     if page > 0: nav_row.append(InlineKeyboardButton("◀️", callback_data=f"page_{page-1}"))
     nav_row.append(InlineKeyboardButton("📥 Download ALL", callback_data="dl_all"))
-    if end_index < len(chapters): nav_row.append(InlineKeyboardButton("▶️", callback_data=f"page_{page+1}"))
+    if end_index < len(chapter_buttons): nav_row.append(InlineKeyboardButton("▶️", callback_data=f"page_{page+1}"))
     keyboard.append(nav_row)
     keyboard.append([InlineKeyboardButton("« Back to Manga Search", callback_data="back_to_search")])
     return InlineKeyboardMarkup(keyboard)
 
+def get_chapter_keyboard(context: ContextTypes.DEFAULT_TYPE, page: int = 0) -> InlineKeyboardMarkup:
+    """Returns the chapter keyboard for a page, building it only once per selected manga."""
+    keyboards = context.user_data.setdefault('chapter_keyboards', {})
+    if page not in keyboards: keyboards[page] = build_chapter_keyboard(context.user_data['chapter_buttons'], page)
+    return keyboards[page]
+
 # --- Conversation Handlers ---
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await update.message.reply_text('Hi! I am the Manga Downloader Bot.\n\nSend me the title of a manga to search for, or /cancel.')
@@ -109,13 +165,14 @@ async def search_manga(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     query = update.message.text
     await update.message.reply_text(f'Searching for "{query}"...')
     try:
-        results = api.search_manga(query)
+        results = await asyncio.to_thread(api.search_manga, query) # Keep the event loop free for other chats
         if not results:
             await update.message.reply_text("Sorry, couldn't find anything. Try another title or /cancel.")
             return SEARCH
         context.user_data['search_results'] = results
         keyboard = [[InlineKeyboardButton(f"{i+1}. {manga.get('title', 'N/A')}", callback_data=f'manga_{i}')] for i, manga in enumerate(results)]
-        await update.message.reply_text('Here are the results. Please choose one:', reply_markup=InlineKeyboardMarkup(keyboard))
+        context.user_data['search_keyboard'] = InlineKeyboardMarkup(keyboard) # Reused by back_to_search
+        await update.message.reply_text('Here are the results. Please choose one:', reply_markup=context.user_data['search_keyboard'])
         return SELECT_MANGA
     except Exception as e:
         await update.message.reply_text(f'An error occurred: {e}')
@@ -129,12 +186,15 @@ async def select_manga(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     context.user_data['selected_manga'] = manga
     await query.edit_message_text(text=f'Fetching chapters for "{manga["title"]}"...')
     try:
-        chapters = api.get_chapters(manga['hid'])
+        chapters = await asyncio.to_thread(api.get_chapters, manga['hid'])
         if not chapters:
             await query.edit_message_text(text=f'"{manga["title"]}" has no downloadable chapters.')
             return ConversationHandler.END
         context.user_data['chapters'] = chapters
-        reply_markup = build_chapter_keyboard(chapters, page=0)
+        context.user_data['chapters_by_hid'] = {c['hid']: c for c in chapters}
+        context.user_data['chapter_buttons'] = build_chapter_buttons(chapters) # Formatted once, sliced per page
+        context.user_data['chapter_keyboards'] = {}
+        reply_markup = get_chapter_keyboard(context, page=0)
         await query.edit_message_text(text=f'You selected "{manga["title"]}". Choose a chapter or download all:', reply_markup=reply_markup)
         return SELECT_CHAPTER
     except Exception as e:
@@ -145,15 +205,14 @@ async def change_chapter_page(update: Update, context: ContextTypes.DEFAULT_TYPE
     query = update.callback_query
     await query.answer()
     page = int(query.data.split('_')[-1])
-    reply_markup = build_chapter_keyboard(context.user_data['chapters'], page)
+    reply_markup = get_chapter_keyboard(context, page)
     await query.edit_message_text(text="Choose a chapter or download all:", reply_markup=reply_markup)
     return SELECT_CHAPTER
 
 async def back_to_search(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     query = update.callback_query
     await query.answer()
-    keyboard = [[InlineKeyboardButton(f"{i+1}. {m.get('title', 'N/A')}", callback_data=f'manga_{i}')] for i, m in enumerate(context.user_data['search_results'])]
-    await query.edit_message_text('Here are the results again:', reply_markup=InlineKeyboardMarkup(keyboard))
+    await query.edit_message_text('Here are the results again:', reply_markup=context.user_data['search_keyboard'])
     return SELECT_MANGA
 
 async def download_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -168,7 +227,7 @@ async def download_action(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         msg = await query.edit_message_text(f"Preparing to download all {len(chapters_to_download)} chapters...")
     else: # Single chapter
         chapter_hid = query.data.split('_')[1]
-        chapter = next((ch for ch in all_chapters if ch['hid'] == chapter_hid), None)
+        chapter = context.user_data['chapters_by_hid'][chapter_hid]
         chapters_to_download.append(chapter)
         archive_title = f"{manga['title']}_Ch_{chapter.get('chap', 'N/A')}"
         msg = await query.edit_message_text(f"Preparing to download Chapter {chapter.get('chap', 'N/A')}...")
@@ -176,6 +235,18 @@ async def download_action(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     context.job_queue.run_once(archive_worker, 0, chat_id=query.message.chat_id, data={'message_id': msg.message_id, 'archive_title': archive_title, 'chapters': chapters_to_download}, name=str(query.message.chat_id))
     return ConversationHandler.END
 
+async def fetch_page(client: httpx.AsyncClient, sem: asyncio.Semaphore, url: str) -> bytes:
+    """Download one page image, holding a semaphore slot for the duration of the request."""
+    async with sem:
+        response = await client.get(url, timeout=15)
+        response.raise_for_status()
+        return response.content
+
+async def fetch_chapter_pages(client: httpx.AsyncClient, sem: asyncio.Semaphore, chapter_hid: str) -> List[Dict]:
+    """Fetch the page list of one chapter, holding a semaphore slot for the duration of the request."""
+    async with sem:
+        return await api.aget_chapter_pages(client, chapter_hid)
+
 # --- archive_worker with improved progress reporting and auto-splitting ---
 async def archive_worker(context: ContextTypes.DEFAULT_TYPE):
     job = context.job
@@ -184,92 +255,158 @@ async def archive_worker(context: ContextTypes.DEFAULT_TYPE):
     
     is_single_chapter_download = "_Ch_" in archive_title
     safe_title = "".join(c for c in archive_title if c.isalnum() or c in (' ', '_')).rstrip()
-    temp_dir = f"./temp_{chat_id}"
     
-    downloaded_page_paths = []
-    total_pages_for_all_chapters = 0
+    last_status_text, last_edit_ts = None, 0.0
+    download_text, upload_text = "", "" # Both lines of the status message; see show_status
+    zipf, part_buf, pages_in_current_part, part_num = None, None, 0, 1
+    part_size = 0 # Final size of the current part if it were closed now
+    created_parts = [] # Every part buffer this job created, released in finally
+    
+    # Pipeline: downloader -> page_queue -> packer -> upload_queue -> uploader.
+    # Parts are built in memory; bounded queues cap peak memory (pages, and at most three parts of SAFE_LIMIT).
+    page_queue = asyncio.Queue(maxsize=32)
+    upload_queue = asyncio.Queue(maxsize=1)
+    
+    async def edit_status(text: str, force: bool = False) -> None:
+        """Edit the status message at most once per PROGRESS_INTERVAL, skipping edits that change nothing."""
+        nonlocal last_status_text, last_edit_ts
+        now = time.monotonic()
+        if text == last_status_text or (not force and now - last_edit_ts < PROGRESS_INTERVAL): return
+        last_status_text, last_edit_ts = text, now
+        await context.bot.edit_message_text(text=text, chat_id=chat_id, message_id=message_id)
+    
+    async def show_status(force: bool = False) -> None:
+        """Show download progress and the part being uploaded together, so neither edit hides the other."""
+        await edit_status("\n".join(text for text in (download_text, upload_text) if text), force=force)
+    
+    async def close_part() -> None:
+        """Close the current CBZ part and hand it to the uploader."""
+        nonlocal zipf, part_num
+        zipf.close()
+        zipf = None
+        cbz_filename = f"{safe_title}_Part_{part_num}.cbz" if not is_single_chapter_download else f"{safe_title}.cbz"
+        part_buf.seek(0)
+        await upload_queue.put((part_buf, cbz_filename))
+        part_num += 1
+    
+    async def add_page(page_number: int, img_data: bytes) -> None:
+        """Write one page straight into the current CBZ part, rolling over to a new part before SAFE_LIMIT."""
+        nonlocal zipf, part_buf, pages_in_current_part, part_size
+        arcname = f"{page_number:04d}.jpg" # Global page number keeps reading order across parts
+        # STORED entry: 30-byte local header + 46-byte central directory record, each followed by the name
+        entry_size = len(img_data) + 30 + 46 + 2 * len(arcname)
+        if zipf is not None and pages_in_current_part > 0 and part_size + entry_size > SAFE_LIMIT:
+            await close_part()
+        if zipf is None:
+            part_buf = io.BytesIO()
+            created_parts.append(part_buf)
+            # Keep ZIP_STORED: JPEG pages are already compressed, DEFLATE would burn CPU for ~0% gain.
+            # allowZip64=True is already the default; passing it only documents that Zip64 parts are acceptable.
+            zipf = zipfile.ZipFile(part_buf, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+            pages_in_current_part = 0
+            part_size = 22 # End-of-central-directory record
+        zipf.writestr(arcname, img_data)
+        pages_in_current_part += 1
+        part_size += entry_size
+    
+    async def packer() -> None:
+        while True:
+            item = await page_queue.get()
+            if item is None: break
+            await add_page(*item)
+        if zipf is not None: await close_part()
+        await upload_queue.put(None)
+    
+    async def uploader() -> None:
+        nonlocal upload_text
+        while True:
+            item = await upload_queue.get()
+            if item is None: return
+            cbz_buf, cbz_filename = item
+            upload_text = f"Uploading: {cbz_filename}..."
+            await show_status(force=True)
+            await context.bot.send_document(chat_id=chat_id, document=cbz_buf, filename=cbz_filename, read_timeout=120, write_timeout=120)
+            cbz_buf.close()
+            upload_text = ""
     
     try:
-        # First, pre-calculate total pages to improve progress reporting
-        chapter_page_counts = {}
-        for i, chapter in enumerate(job.data['chapters']):
-            chapter_hid = chapter['hid']
-            chapter_pages = api.get_chapter_pages(chapter_hid)
-            chapter_page_counts[chapter_hid] = len(chapter_pages)
-            total_pages_for_all_chapters += len(chapter_pages)
+        # HTTP/2 multiplexes the concurrent page requests over a few connections; falls back to HTTP/1.1 keep-alive
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        async with httpx.AsyncClient(http2=True, headers=api.headers, limits=limits, follow_redirects=True) as client:
+            sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
             
-        if total_pages_for_all_chapters == 0:
-            await context.bot.edit_message_text("Could not get page counts. Aborting.", chat_id=chat_id, message_id=message_id)
-            await context.bot.send_message(chat_id=chat_id, text="Error retrieving page information. Please try again or /start a new search.")
-            return
-
-        if os.path.exists(temp_dir): shutil.rmtree(temp_dir)
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        current_page_global_index = 1 # For overall page progress
-        
-        for i, chapter in enumerate(job.data['chapters']):
-            chapter_hid = chapter['hid']
-            num_pages_in_chapter = chapter_page_counts[chapter_hid]
+            # First, fetch every chapter's page list once (concurrently); it drives both progress reporting and the downloads
+            chapter_hids = [chapter['hid'] for chapter in job.data['chapters']]
+            manifests = await asyncio.gather(*[fetch_chapter_pages(client, sem, chapter_hid) for chapter_hid in chapter_hids])
+            chapter_pages_cache = dict(zip(chapter_hids, manifests))
+            total_pages_for_all_chapters = sum(len(pages) for pages in manifests)
+            
+            if total_pages_for_all_chapters == 0:
+                await context.bot.edit_message_text("Could not get page counts. Aborting.", chat_id=chat_id, message_id=message_id)
+                await context.bot.send_message(chat_id=chat_id, text="Error retrieving page information. Please try again or /start a new search.")
+                return
             
-            for page_num_in_chapter in range(num_pages_in_chapter):
-                # Update message with detailed progress
+            # Queue every page of every chapter in reading order
+            page_jobs = []
+            for chapter in job.data['chapters']:
+                pages = chapter_pages_cache[chapter['hid']]
+                num_pages_in_chapter = len(pages)
+                for page_num_in_chapter, page in enumerate(pages):
+                    if 'b2key' not in page or not page['b2key']: continue
+                    page_jobs.append((f"{api.cdn_url}/{page['b2key']}", chapter, page_num_in_chapter, num_pages_in_chapter))
+            
+            if not page_jobs:
+                await context.bot.edit_message_text("Could not download any images. Aborting.", chat_id=chat_id, message_id=message_id)
+                await context.bot.send_message(chat_id=chat_id, text="No pages could be downloaded for this chapter/manga. Please try again or /start a new search.")
+                return
+            
+            total_pages = len(page_jobs)
+            completed = 0
+            
+            async def report_progress(chapter, page_num_in_chapter, num_pages_in_chapter):
+                nonlocal download_text
+                if time.monotonic() - last_edit_ts < PROGRESS_INTERVAL and completed < total_pages: return
                 progress_percentage_chapter = math.floor(((page_num_in_chapter + 1) / num_pages_in_chapter) * 100)
-                progress_percentage_overall = math.floor((current_page_global_index / total_pages_for_all_chapters) * 100)
-                
-                status_text = (
+                progress_percentage_overall = math.floor((completed / total_pages) * 100)
+                download_text = (
                     f"Downloading Ch. {chapter.get('chap', 'N/A')} ({page_num_in_chapter + 1}/{num_pages_in_chapter} pages, {progress_percentage_chapter}%)\n"
-                    f"Overall: {current_page_global_index}/{total_pages_for_all_chapters} pages, {progress_percentage_overall}%"
+                    f"Overall: {completed}/{total_pages} pages, {progress_percentage_overall}%"
                 )
-                await context.bot.edit_message_text(text=status_text, chat_id=chat_id, message_id=message_id)
-                
-                pages = api.get_chapter_pages(chapter_hid) # Re-fetch just in case, or use cached if logic allows
-                page = pages[page_num_in_chapter]
-                
-                if 'b2key' not in page or not page['b2key']: continue
-                img_data = api.download_image(f"https://meo.comick.pictures/{page['b2key']}")
-                img_path = os.path.join(temp_dir, f"{current_page_global_index:04d}.jpg") # Use global page index for sorting
-                with open(img_path, 'wb') as f: f.write(img_data)
-                downloaded_page_paths.append(img_path)
-                current_page_global_index += 1
-        
-        if not downloaded_page_paths:
-            await context.bot.edit_message_text("Could not download any images. Aborting.", chat_id=chat_id, message_id=message_id)
-            await context.bot.send_message(chat_id=chat_id, text="No pages could be downloaded for this chapter/manga. Please try again or /start a new search.")
-            return
-
-        # --- AUTO-SPLITTING LOGIC WITH PROGRESS BAR FOR ARCHIVE CREATION ---
-        part_num = 1
-        page_index = 0
-        
-        while page_index < len(downloaded_page_paths):
-            part_name = f"{safe_title}_Part_{part_num}" if not is_single_chapter_download else safe_title
-            cbz_filename = f"{part_name}.cbz"
+                await show_status(force=completed == total_pages)
             
-            # Progress for archive creation
-            progress_percentage_archive = math.floor((page_index / len(downloaded_page_paths)) * 100)
-            await context.bot.edit_message_text(f"Creating archive: {os.path.basename(cbz_filename)}... ({progress_percentage_archive}%)", chat_id=chat_id, message_id=message_id)
-
-            with zipfile.ZipFile(cbz_filename, 'w') as zipf:
-                pages_in_current_part = 0
-                while page_index < len(downloaded_page_paths):
-                    page_path = downloaded_page_paths[page_index]
-                    zipf.write(page_path, arcname=os.path.basename(page_path))
-                    
-                    # Check size after adding each page
-                    if os.path.getsize(cbz_filename) > SAFE_LIMIT and pages_in_current_part > 0: # Ensure at least one page added
-                        page_index -= 1 # Revert to put this page in the next part
-                        break
-                    pages_in_current_part += 1
-                    page_index += 1
+            async def download_page(url, chapter, page_num_in_chapter, num_pages_in_chapter):
+                nonlocal completed
+                img_data = await fetch_page(client, sem, url)
+                completed += 1
+                await report_progress(chapter, page_num_in_chapter, num_pages_in_chapter)
+                return img_data
             
-            # Upload
-            await context.bot.edit_message_text(f"Uploading: {os.path.basename(cbz_filename)}...", chat_id=chat_id, message_id=message_id)
-            with open(cbz_filename, 'rb') as cbz_file:
-                await context.bot.send_document(chat_id=chat_id, document=cbz_file, filename=cbz_filename, read_timeout=120, write_timeout=120)
+            async def downloader() -> None:
+                """Download pages concurrently but enqueue them in reading order."""
+                in_flight = collections.deque()
+                try:
+                    for page_number, page_job in enumerate(page_jobs, start=1):
+                        in_flight.append((page_number, asyncio.create_task(download_page(*page_job))))
+                        if len(in_flight) >= DOWNLOAD_CONCURRENCY * 2:
+                            number, task = in_flight.popleft()
+                            await page_queue.put((number, await task))
+                    while in_flight:
+                        number, task = in_flight.popleft()
+                        await page_queue.put((number, await task))
+                    await page_queue.put(None)
+                finally:
+                    for _, task in in_flight: task.cancel()
+                    # Let cancelled requests unwind before the client closes, and collect any failures
+                    await asyncio.gather(*(task for _, task in in_flight), return_exceptions=True)
             
-            os.remove(cbz_filename)
-            part_num += 1
+            # --- DOWNLOAD, PACK (WITH AUTO-SPLITTING) AND UPLOAD CONCURRENTLY ---
+            stages = [asyncio.create_task(stage()) for stage in (downloader, packer, uploader)]
+            try:
+                await asyncio.gather(*stages)
+            except BaseException:
+                for stage in stages: stage.cancel()
+                await asyncio.gather(*stages, return_exceptions=True)
+                raise
 
         # Final message after all parts are sent
         final_message = f"Your download of '{archive_title}' is complete!"
@@ -284,11 +421,8 @@ async def archive_worker(context: ContextTypes.DEFAULT_TYPE):
         await context.bot.edit_message_text(f"An unexpected error occurred: {e}", chat_id=chat_id, message_id=message_id)
         await context.bot.send_message(chat_id=chat_id, text="Please try again or /start a new search.")
     finally:
-        if os.path.exists(temp_dir): shutil.rmtree(temp_dir)
-        for f in os.listdir('.'):
-            if (f.endswith('.cbz') or f.endswith('.zip')) and f.startswith(safe_title):
-                try: os.remove(f)
-                except OSError: pass
+        if zipf is not None: zipf.close()
+        for buf in created_parts: buf.close()
 
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await update.message.reply_text('Okay, operation cancelled. To start a new search, click /start.')